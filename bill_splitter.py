@@ -1,15 +1,50 @@
 #!/usr/bin/env python3
 """
 Bill Splitter - Production-quality CLI for splitting restaurant bills fairly.
-Uses Decimal for precise money calculations. Python 3.10+ required.
+Uses Decimal to parse input and integer cents for all money arithmetic.
+Python 3.10+ required.
 """
 
-from decimal import Decimal, ROUND_HALF_UP, getcontext
-from typing import Any
+from collections.abc import Callable
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP, getcontext
+from typing import TextIO, TypeVar
+import argparse
+import io
+import re
 import sys
 
-# Set high precision for intermediate calculations
-getcontext().prec = 28
+T = TypeVar("T")
+
+# Decimal is only used to parse input into cents, so 12 significant digits
+# (up to $9,999,999,999.99) is enough; larger amounts are rejected as invalid
+_DECIMAL_PREC = 12
+
+# Smallest magnitude that no longer fits _DECIMAL_PREC digits once rounded to cents
+_MAX_AMOUNT = Decimal("9999999999.995")
+
+# Shared Decimal constants, built once instead of on every call
+_CENT = Decimal("0.01")
+_HUNDRED = Decimal("100")
+_ZERO = Decimal("0")
+
+# Plain decimal amounts only: no exponents, NaN or Infinity
+_AMOUNT_RE = re.compile(r"[-+]?(?:\d+(?:\.\d*)?|\.\d+)")
+
+
+@dataclass(slots=True)
+class Person:
+    """One diner: name, individual items and totals, all in integer cents."""
+    name: str
+    name_lc: str
+    items: list[int]
+    subtotal: int
+    shared: int = 0
+
+
+def _configure_decimal() -> None:
+    """Set the Decimal context precision; called by each entry point, not at import."""
+    getcontext().prec = _DECIMAL_PREC
 
 
 def print_welcome() -> None:
@@ -19,44 +54,93 @@ def print_welcome() -> None:
     print("=" * 60 + "\n")
 
 
-def read_money(prompt: str) -> Decimal:
+def _to_hundredths(value: Decimal) -> int:
+    """Convert a Decimal to integer hundredths (cents or basis points), rounding half-up."""
+    return int(value.quantize(_CENT, rounding=ROUND_HALF_UP) * _HUNDRED)
+
+
+def _parse_decimal(text: str) -> Decimal:
     """
-    Read a monetary amount from user input.
-    Re-prompts on invalid input. Accepts zero or positive values.
+    Parse a plain decimal string into an exact, unrounded Decimal.
+    Raises ValueError for anything that is not a plain decimal number
+    or is too large to round to cents under the Decimal context.
+    """
+    if not _AMOUNT_RE.fullmatch(text):
+        raise ValueError(f"not a decimal amount: {text!r}")
+    value = Decimal(text)
+    if value.copy_abs() >= _MAX_AMOUNT:
+        raise ValueError(f"amount too large: {text!r}")
+    return value
+
+
+def _read_validated(
+    prompt: str,
+    parse: Callable[[str], T],
+    check: Callable[[T], str | None],
+    empty_msg: str,
+    invalid_msg: str,
+) -> T:
+    """
+    Read and parse a value from user input.
+    check returns an error message for a parsed but unacceptable value, or None.
+    Re-prompts with the matching message until the input is non-empty,
+    parses, and passes check.
     """
     while True:
         user_input = input(prompt).strip()
         if not user_input:
-            print("Input cannot be empty. Please enter a number.")
+            print(empty_msg)
             continue
         try:
-            value = Decimal(user_input)
-            if value < 0:
-                print("Amount cannot be negative. Please try again.")
-                continue
-            return value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-        except Exception:
-            print("Invalid number. Please enter a valid amount.")
+            value = parse(user_input)
+        except (InvalidOperation, ValueError):
+            print(invalid_msg)
+            continue
+        error = check(value)
+        if error is not None:
+            print(error)
+            continue
+        return value
 
 
-def read_percentage(prompt: str) -> Decimal:
+def read_money(prompt: str) -> int:
     """
-    Read a percentage value (e.g., 15 for 15%).
+    Read a monetary amount from user input and return it in integer cents.
     Re-prompts on invalid input. Accepts zero or positive values.
     """
-    while True:
-        user_input = input(prompt).strip()
-        if not user_input:
-            print("Input cannot be empty. Please enter a percentage.")
-            continue
-        try:
-            value = Decimal(user_input)
-            if value < 0:
-                print("Percentage cannot be negative. Please try again.")
-                continue
-            return value
-        except Exception:
-            print("Invalid percentage. Please enter a valid number.")
+    value = _read_validated(
+        prompt,
+        _parse_decimal,
+        lambda v: "Amount cannot be negative. Please try again." if v < 0 else None,
+        "Input cannot be empty. Please enter a number.",
+        "Invalid number. Please enter a valid amount.",
+    )
+    return _to_hundredths(value)
+
+
+def _check_percentage(value: Decimal) -> str | None:
+    """Return an error message if value is not a usable percentage, else None."""
+    if value < 0:
+        return "Percentage cannot be negative. Please try again."
+    if value.quantize(_CENT) != value:
+        return "Percentage can have at most 2 decimal places. Please try again."
+    return None
+
+
+def read_percentage(prompt: str) -> int:
+    """
+    Read a percentage value (e.g., 15 for 15%) and return it in basis points.
+    Re-prompts on invalid input. Accepts zero or positive values with at
+    most two decimal places, so the basis-point value is exact.
+    """
+    value = _read_validated(
+        prompt,
+        _parse_decimal,
+        _check_percentage,
+        "Input cannot be empty. Please enter a percentage.",
+        "Invalid percentage. Please enter a valid number.",
+    )
+    return _to_hundredths(value)
 
 
 def read_nonempty_str(prompt: str) -> str:
@@ -90,66 +174,99 @@ def read_int_min(prompt: str, min_value: int) -> int:
     Read an integer from user with minimum value constraint.
     Re-prompts on invalid input.
     """
-    while True:
-        user_input = input(prompt).strip()
-        if not user_input:
-            print("Input cannot be empty. Please enter a number.")
-            continue
-        try:
-            value = int(user_input)
-            if value < min_value:
-                print(f"Must be at least {min_value}. Please try again.")
-                continue
-            return value
-        except ValueError:
-            print("Invalid number. Please enter a whole number.")
+    return _read_validated(
+        prompt,
+        int,
+        lambda v: f"Must be at least {min_value}. Please try again." if v < min_value else None,
+        "Input cannot be empty. Please enter a number.",
+        "Invalid number. Please enter a whole number.",
+    )
 
 
-def parse_items_csv(prompt: str) -> list[Decimal]:
+def parse_items_csv(prompt: str) -> tuple[list[int], int]:
     """
-    Parse comma-separated monetary amounts.
-    Returns empty list if input is empty (person has no individual items).
+    Parse comma-separated monetary amounts into integer cents.
+    Returns the items and their subtotal.
+    Returns ([], 0) if input is empty (person has no individual items).
     Re-prompts on malformed values.
     """
     while True:
         user_input = input(prompt).strip()
         if not user_input:
-            return []
-        
-        items: list[Decimal] = []
-        parts = user_input.split(",")
+            return [], 0
         
         try:
-            for part in parts:
-                stripped = part.strip()
-                if stripped:
-                    amount = Decimal(stripped)
-                    if amount < 0:
-                        print("Amounts cannot be negative. Please try again.")
-                        raise ValueError
-                    items.append(amount.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP))
-            return items
-        except Exception:
+            amounts = [
+                _parse_decimal(stripped)
+                for stripped in filter(None, (part.strip() for part in user_input.split(",")))
+            ]
+        except (InvalidOperation, ValueError):
             print("Invalid format. Enter comma-separated amounts (e.g., 12.50, 7.25).")
+            continue
+        
+        # Check the sign before rounding so e.g. -0.001 is not accepted as 0.00
+        if any(amount < 0 for amount in amounts):
+            print("Amounts cannot be negative. Please try again.")
+            print("Invalid format. Enter comma-separated amounts (e.g., 12.50, 7.25).")
+            continue
+        
+        items = [_to_hundredths(amount) for amount in amounts]
+        return items, sum(items)
 
 
 def format_money(x: Decimal) -> str:
     """Format a Decimal as currency string (e.g., $12.34)."""
-    quantized = x.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    quantized = x.quantize(_CENT, rounding=ROUND_HALF_UP)
     return f"${quantized}"
 
 
-def compute_tip_from_percent(bill: Decimal, percent: Decimal) -> Decimal:
-    """Calculate tip amount from bill and percentage."""
-    return (bill * percent / Decimal("100")).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+def format_cents(c: int) -> str:
+    """Format integer cents as currency string (e.g., 1234 -> $12.34)."""
+    return f"${c // 100}.{c % 100:02d}"
+
+
+def format_percent(bp: int) -> str:
+    """Format basis points as a percentage string (e.g., 2500 -> 25%, 1850 -> 18.5%)."""
+    whole, hundredths = divmod(bp, 100)
+    if hundredths == 0:
+        return f"{whole}%"
+    return f"{whole}.{hundredths:02d}".rstrip("0") + "%"
 
 
-def collect_people(n: int) -> list[dict[str, Any]]:
+def format_split(shares: list[int]) -> str:
+    """
+    Format the shares from split_cents.
+    Shows one amount if all shares are equal, else every share (e.g., $3.34 / $3.33 / $3.33).
+    """
+    if min(shares) == max(shares):
+        return format_cents(shares[0])
+    return " / ".join(format_cents(share) for share in shares)
+
+
+def compute_tip_from_percent(bill_cents: int, percent_bp: int) -> int:
+    """Calculate tip in cents from bill (cents) and percentage (basis points), rounding half-up."""
+    return (bill_cents * percent_bp + 5000) // 10000
+
+
+def split_cents(amount: int, n: int) -> list[int]:
+    """
+    Split an amount in cents into n shares that add back up to the amount.
+    Leftover cents go one each to the first shares.
+    """
+    base, remainder = divmod(amount, n)
+    shares = [base] * n
+    for i in range(remainder):
+        shares[i] += 1
+    return shares
+
+
+def collect_people(n: int) -> list[Person]:
     """
     Collect information for n people.
-    Each person: name (unique, non-empty), items (list of Decimal), subtotal, shared (default 0).
+    Each Person: name (unique, non-empty), case-folded name, items (list of cents),
+    subtotal, shared (default 0).
     """
-    people: list[dict[str, Any]] = []
+    people: list[Person] = []
     existing_names: set[str] = set()
     
     print("\n" + "-" * 60)
@@ -164,33 +281,27 @@ def collect_people(n: int) -> list[dict[str, Any]]:
         # Get unique name
         while True:
             name = read_nonempty_str("  Name: ")
-            if name.lower() in existing_names:
+            name_lc = name.casefold()
+            if name_lc in existing_names:
                 print("  Name already used. Please enter a different name.")
                 continue
-            existing_names.add(name.lower())
+            existing_names.add(name_lc)
             break
         
         # Get items
-        items = parse_items_csv("  Items (comma-separated amounts): ")
-        subtotal = sum(items, Decimal("0"))
+        items, subtotal = parse_items_csv("  Items (comma-separated amounts): ")
         
-        person: dict[str, Any] = {
-            "name": name,
-            "items": items,
-            "subtotal": subtotal,
-            "shared": Decimal("0")
-        }
-        people.append(person)
+        people.append(Person(name=name, name_lc=name_lc, items=items, subtotal=subtotal))
         
-        print(f"  Subtotal: {format_money(subtotal)}\n")
+        print(f"  Subtotal: {format_cents(subtotal)}\n")
     
     return people
 
 
-def handle_shared_items(people: list[dict[str, Any]]) -> None:
+def handle_shared_items(people: list[Person]) -> None:
     """
     Handle shared items if any.
-    Mutates people list by adding to each person's 'shared' total.
+    Mutates people list by adding to each person's shared total.
     """
     print("\n" + "-" * 60)
     print("STEP 6: Shared Items")
@@ -204,7 +315,7 @@ def handle_shared_items(people: list[dict[str, Any]]) -> None:
     num_shared = read_int_min("How many items were shared? ", 1)
     
     # Build name lookup (case-insensitive)
-    name_map: dict[str, dict[str, Any]] = {p["name"].lower(): p for p in people}
+    name_map: dict[str, Person] = {p.name_lc: p for p in people}
     
     print()
     for i in range(num_shared):
@@ -225,83 +336,98 @@ def handle_shared_items(people: list[dict[str, Any]]) -> None:
                 print("  At least 2 people must share an item.")
                 continue
             
-            # Validate all names exist
-            sharers: list[dict[str, Any]] = []
-            all_valid = True
+            # Case-folded name -> name as typed, in entry order; repeats collapse
+            requested: dict[str, str] = {name.casefold(): name for name in names if name}
             
-            for name in names:
-                if not name:
-                    continue
-                name_lower = name.lower()
-                if name_lower not in name_map:
-                    print(f"  '{name}' not found. Check spelling!")
-                    all_valid = False
-                    break
-                sharers.append(name_map[name_lower])
+            # Validate all names exist
+            missing = requested.keys() - name_map.keys()
+            if missing:
+                for name_lc, name in requested.items():
+                    if name_lc in missing:
+                        print(f"  '{name}' not found. Check spelling!")
+                continue
             
-            if not all_valid or len(sharers) < 2:
+            if len(requested) < 2:
+                print("  At least 2 different people must share an item.")
                 continue
             
+            sharers: list[Person] = [name_map[name_lc] for name_lc in requested]
             break
         
         # Split amount among sharers
-        split_amount = amount / Decimal(len(sharers))
+        split_amounts = split_cents(amount, len(sharers))
         
-        for sharer in sharers:
-            sharer["shared"] += split_amount
+        for sharer, split_amount in zip(sharers, split_amounts, strict=True):
+            sharer.shared += split_amount
         
-        print(f"  Each person pays: {format_money(split_amount)}\n")
+        print(f"  Each person pays: {format_split(split_amounts)}\n")
 
 
-def compute_tax_tip_share(tax: Decimal, tip: Decimal, n: int) -> Decimal:
-    """Calculate per-person share of tax and tip."""
-    return (tax + tip) / Decimal(n)
+def compute_tax_tip_share(tax: int, tip: int, n: int) -> list[int]:
+    """Calculate each person's share of tax and tip in cents."""
+    return split_cents(tax + tip, n)
 
 
-def render_bill_summary(bill: Decimal, tax: Decimal, tip: Decimal, n: int) -> None:
-    """Display bill summary."""
-    total = bill + tax + tip
-    
-    print("\n" + "=" * 60)
-    print("FINAL RESULTS")
-    print("=" * 60 + "\n")
-    print("Bill Summary:")
-    print(f"  Bill (before tax): {format_money(bill)}")
-    print(f"  Tax:               {format_money(tax)}")
-    print(f"  Tip:               {format_money(tip)}")
-    print(f"  Total:             {format_money(total)}")
-    print(f"  Split among:       {n} people")
-    print()
+def compute_totals_owed(people: list[Person], tax_tip_shares: list[int]) -> list[int]:
+    """Calculate each person's total owed in cents, for the whole party in one pass."""
+    return [
+        person.subtotal + person.shared + tax_tip_share
+        for person, tax_tip_share in zip(people, tax_tip_shares, strict=True)
+    ]
 
 
-def render_person_breakdown(people: list[dict[str, Any]], tax_tip_share: Decimal) -> None:
-    """Display breakdown for each person."""
-    print("Individual Breakdowns:")
-    print("-" * 60)
+def render_bill_summary(bill: int, tax: int, tip: int, n: int, out: TextIO) -> None:
+    """Write bill summary to out in one call."""
+    total = bill + tax + tip
+    
+    buf: list[str] = [
+        "\n" + "=" * 60,
+        "FINAL RESULTS",
+        "=" * 60 + "\n",
+        "Bill Summary:",
+        f"  Bill (before tax): {format_cents(bill)}",
+        f"  Tax:               {format_cents(tax)}",
+        f"  Tip:               {format_cents(tip)}",
+        f"  Total:             {format_cents(total)}",
+        f"  Split among:       {n} people",
+        "",
+    ]
+    out.write("\n".join(buf) + "\n")
+
+
+def render_person_breakdown(
+    people: list[Person], tax_tip_shares: list[int], totals_owed: list[int], out: TextIO
+) -> None:
+    """Write breakdown for each person to out in one call."""
+    buf: list[str] = ["Individual Breakdowns:", "-" * 60]
     
-    for person in people:
-        print(f"\n{person['name']}:")
+    for person, tax_tip_share, total_owed in zip(
+        people, tax_tip_shares, totals_owed, strict=True
+    ):
+        buf.append(f"\n{person.name}:")
         
         # Individual items
-        if person["items"]:
-            items_str = ", ".join(format_money(item) for item in person["items"])
-            print(f"  Individual items: {items_str}")
-        print(f"  Individual subtotal: {format_money(person['subtotal'])}")
+        if person.items:
+            items_str = ", ".join(format_cents(item) for item in person.items)
+            buf.append(f"  Individual items: {items_str}")
+        buf.append(f"  Individual subtotal: {format_cents(person.subtotal)}")
         
         # Shared items
-        print(f"  Shared items total:  {format_money(person['shared'])}")
+        buf.append(f"  Shared items total:  {format_cents(person.shared)}")
         
         # Tax + tip share
-        print(f"  Tax + Tip share:     {format_money(tax_tip_share)}")
+        buf.append(f"  Tax + Tip share:     {format_cents(tax_tip_share)}")
         
         # Total
-        total_owed = person["subtotal"] + person["shared"] + tax_tip_share
-        print(f"  {'-' * 30}")
-        print(f"  TOTAL OWED:          {format_money(total_owed)}")
+        buf.append(f"  {'-' * 30}")
+        buf.append(f"  TOTAL OWED:          {format_cents(total_owed)}")
+    
+    out.write("\n".join(buf) + "\n")
 
 
 def main() -> None:
     """Main orchestration function."""
+    _configure_decimal()
     print_welcome()
     
     # STEP 1: Bill amount
@@ -321,7 +447,7 @@ def main() -> None:
     print("-" * 60)
     
     tip_included = read_yes_no("Is tip already included in the bill?")
-    tip = Decimal("0")
+    tip = 0
     
     if tip_included:
         tip = read_money("How much is the tip? $")
@@ -330,9 +456,9 @@ def main() -> None:
         if want_tip:
             tip_percent = read_percentage("Enter tip percentage (e.g., 18 for 18%): ")
             tip = compute_tip_from_percent(bill, tip_percent)
-            print(f"Tip amount: {format_money(tip)}")
+            print(f"Tip amount: {format_cents(tip)}")
             
-            if tip_percent > Decimal("20"):
+            if tip_percent > 2000:
                 print("\n🌟 Thank you for your generosity! 🌟")
     
     # STEP 4: Number of people
@@ -347,13 +473,16 @@ def main() -> None:
     # STEP 6: Handle shared items
     handle_shared_items(people)
     
-    # Calculate and display results
-    tax_tip_share = compute_tax_tip_share(tax, tip, num_people)
-    render_bill_summary(bill, tax, tip, num_people)
-    render_person_breakdown(people, tax_tip_share)
+    # Calculate and display results (buffered, written to stdout once)
+    tax_tip_shares = compute_tax_tip_share(tax, tip, num_people)
+    totals_owed = compute_totals_owed(people, tax_tip_shares)
+    out = io.StringIO()
+    render_bill_summary(bill, tax, tip, num_people, out)
+    render_person_breakdown(people, tax_tip_shares, totals_owed, out)
     
-    print("\n" + "=" * 60)
-    print("Thank you! 😊\n")
+    print("\n" + "=" * 60, file=out)
+    print("Thank you! 😊\n", file=out)
+    sys.stdout.write(out.getvalue())
 
 
 def run_demo_calculations() -> None:
@@ -361,65 +490,100 @@ def run_demo_calculations() -> None:
     Demonstrate key calculations without user input.
     Run with: python bill_splitter.py --demo
     """
+    _configure_decimal()
     print("\n" + "=" * 60)
     print("DEMO MODE - Testing Key Calculations")
     print("=" * 60 + "\n")
     
     # Test 1: Tip percent > 20 (generosity message)
     print("Test 1: Tip > 20% (should show generosity)")
-    bill1 = Decimal("100.00")
-    tip_percent1 = Decimal("25")
+    bill1 = 10000
+    tip_percent1 = 2500
     tip1 = compute_tip_from_percent(bill1, tip_percent1)
-    print(f"  Bill: {format_money(bill1)}, Tip %: {tip_percent1}%, Tip: {format_money(tip1)}")
-    if tip_percent1 > Decimal("20"):
+    print(f"  Bill: {format_cents(bill1)}, Tip %: {format_percent(tip_percent1)}, Tip: {format_cents(tip1)}")
+    if tip_percent1 > 2000:
         print("  🌟 Thank you for your generosity! 🌟")
     
     # Test 2: Included tip path
     print("\nTest 2: Tip already included")
-    bill2 = Decimal("150.00")
-    tip2 = Decimal("30.00")
-    print(f"  Bill: {format_money(bill2)}, Included Tip: {format_money(tip2)}")
+    bill2 = 15000
+    tip2 = 3000
+    print(f"  Bill: {format_cents(bill2)}, Included Tip: {format_cents(tip2)}")
     
     # Test 3: No tip path
     print("\nTest 3: No tip")
-    bill3 = Decimal("80.00")
-    tip3 = Decimal("0")
-    print(f"  Bill: {format_money(bill3)}, Tip: {format_money(tip3)}")
+    bill3 = 8000
+    tip3 = 0
+    print(f"  Bill: {format_cents(bill3)}, Tip: {format_cents(tip3)}")
     
     # Test 4: Shared item split
     print("\nTest 4: Shared item calculation")
-    shared_amount = Decimal("24.00")
+    shared_amount = 2400
     num_sharers = 2
-    split = shared_amount / Decimal(num_sharers)
-    print(f"  Shared amount: {format_money(shared_amount)}")
+    split = split_cents(shared_amount, num_sharers)
+    print(f"  Shared amount: {format_cents(shared_amount)}")
     print(f"  Split among: {num_sharers} people")
-    print(f"  Each pays: {format_money(split)}")
+    print(f"  Each pays: {format_split(split)}")
     
     # Test 5: Tax + Tip split
     print("\nTest 5: Tax + Tip per-person calculation")
-    tax5 = Decimal("15.00")
-    tip5 = Decimal("37.50")
+    tax5 = 1500
+    tip5 = 3750
     num_people5 = 3
     share = compute_tax_tip_share(tax5, tip5, num_people5)
-    print(f"  Tax: {format_money(tax5)}, Tip: {format_money(tip5)}")
+    print(f"  Tax: {format_cents(tax5)}, Tip: {format_cents(tip5)}")
     print(f"  People: {num_people5}")
-    print(f"  Per person: {format_money(share)}")
+    print(f"  Per person: {format_split(share)}")
     
     # Test 6: Decimal precision
     print("\nTest 6: Decimal precision (8.875 / 2)")
     tax6 = Decimal("8.875")
     num_people6 = 2
-    share6 = (tax6 + Decimal("0")) / Decimal(num_people6)
+    share6 = (tax6 + _ZERO) / Decimal(num_people6)
     print(f"  Tax: {format_money(tax6)}, People: {num_people6}")
     print(f"  Per person (exact): {share6}")
     print(f"  Per person (formatted): {format_money(share6)}")
     
+    # Test 7: Integer-cents sweep against Decimal reference
+    print("\nTest 7: Integer-cents sweep (tips and splits)")
+    percents7 = [0, 1500, 1800, 1850, 2000, 2500]
+    bills7 = range(0, 100000, 37)
+    sharer_counts7 = range(2, 13)
+    tip_mismatches = 0
+    for bill_cents in bills7:
+        bill_dec = Decimal(bill_cents) / _HUNDRED
+        for percent_bp in percents7:
+            expected = _to_hundredths(bill_dec * (Decimal(percent_bp) / _HUNDRED) / _HUNDRED)
+            if compute_tip_from_percent(bill_cents, percent_bp) != expected:
+                tip_mismatches += 1
+    split_mismatches = 0
+    for amount in bills7:
+        for n in sharer_counts7:
+            shares = split_cents(amount, n)
+            if sum(shares) != amount or max(shares) - min(shares) > 1:
+                split_mismatches += 1
+    print(f"  Tips checked: {len(bills7) * len(percents7)}, mismatches: {tip_mismatches}")
+    print(f"  Splits checked: {len(bills7) * len(sharer_counts7)}, mismatches: {split_mismatches}")
+    
     print("\n" + "=" * 60)
     print("Demo complete!\n")
 
 
-if __name__ == "__main__":
-    if len(sys.argv) > 1 and sys.argv[1] == "--demo":
+def cli(argv: list[str] | None = None) -> None:
+    """Parse command-line arguments and run the interactive or demo mode."""
+    parser = argparse.ArgumentParser(description="Split a restaurant bill fairly.")
+    parser.add_argument(
+        "--demo",
+        action="store_true",
+        help="run the built-in calculation checks without prompting",
+    )
+    args = parser.parse_args(argv)
+    
+    if args.demo:
         run_demo_calculations()
     else:
         main()
+
+
+if __name__ == "__main__":
+    cli()